@@ -24,6 +24,28 @@ from ..config.exceptions import ConfigError
 
 logger = logging.getLogger(__name__)
 
+# Parameters that Config.__getattribute__ resolves through the well context.
+# Built once here rather than on every attribute access.
+_CONTEXT_PARAMETER_ATTRS = frozenset({
+    # HDBSCAN clustering parameters
+    'HDBSCAN_MIN_CLUSTER_SIZE', 'HDBSCAN_MIN_SAMPLES', 'HDBSCAN_EPSILON',
+    'HDBSCAN_METRIC', 'HDBSCAN_CLUSTER_SELECTION_METHOD', 'MIN_POINTS_FOR_CLUSTERING',
+    # Plot/visualization parameters
+    'INDIVIDUAL_PLOT_DPI', 'PLACEHOLDER_PLOT_DPI',
+    'X_AXIS_MIN', 'X_AXIS_MAX', 'Y_AXIS_MIN', 'Y_AXIS_MAX',
+    'X_GRID_INTERVAL', 'Y_GRID_INTERVAL',
+    'INDIVIDUAL_FIGURE_SIZE',
+    # Analysis parameters
+    'BASE_TARGET_TOLERANCE',
+    'TOLERANCE_MULTIPLIER', 'COPY_NUMBER_MULTIPLIER', 'EXPECTED_CENTROIDS', 'COPY_NUMBER_SPEC',
+    'CHROMOSOME_COUNT', 'ENABLE_COPY_NUMBER_ANALYSIS', 'CLASSIFY_CNV_DEVIATIONS',
+    'LOWER_DEVIATION_TARGET', 'UPPER_DEVIATION_TARGET', 'TARGET_NAMES', 'AMPLITUDE_NON_LINEARITY',
+    # Additional processing parameters
+    'MIN_USABLE_DROPLETS', 'COPY_NUMBER_MEDIAN_DEVIATION_THRESHOLD',
+    'TARGET_COLORS'
+})
+
+
 class Config:
     """
     Central configuration settings for the ddQuint pipeline with singleton pattern.
@@ -196,39 +218,20 @@ class Config:
         For parameter attributes, use the context system to get well-specific values.
         This allows per-well parameter customization while maintaining backwards compatibility.
         """
-        # List of parameters that should use context-aware access
-        PARAMETER_ATTRS = {
-            # HDBSCAN clustering parameters
-            'HDBSCAN_MIN_CLUSTER_SIZE', 'HDBSCAN_MIN_SAMPLES', 'HDBSCAN_EPSILON',
-            'HDBSCAN_METRIC', 'HDBSCAN_CLUSTER_SELECTION_METHOD', 'MIN_POINTS_FOR_CLUSTERING',
-            # Plot/visualization parameters  
-            'INDIVIDUAL_PLOT_DPI', 'PLACEHOLDER_PLOT_DPI',
-            'X_AXIS_MIN', 'X_AXIS_MAX', 'Y_AXIS_MIN', 'Y_AXIS_MAX',
-            'X_GRID_INTERVAL', 'Y_GRID_INTERVAL',
-            'INDIVIDUAL_FIGURE_SIZE',
-            # Analysis parameters
-            'BASE_TARGET_TOLERANCE',
-            'TOLERANCE_MULTIPLIER', 'COPY_NUMBER_MULTIPLIER', 'EXPECTED_CENTROIDS', 'COPY_NUMBER_SPEC',
-            'CHROMOSOME_COUNT', 'ENABLE_COPY_NUMBER_ANALYSIS', 'CLASSIFY_CNV_DEVIATIONS',
-            'LOWER_DEVIATION_TARGET', 'UPPER_DEVIATION_TARGET', 'TARGET_NAMES', 'AMPLITUDE_NON_LINEARITY',
-            # Additional processing parameters
-            'MIN_USABLE_DROPLETS', 'COPY_NUMBER_MEDIAN_DEVIATION_THRESHOLD',
-            'TARGET_COLORS'
-        }
         
         # For parameter attributes, use context-aware access
-        if name in PARAMETER_ATTRS:
+        if name in _CONTEXT_PARAMETER_ATTRS:
             try:
                 # Get the context-aware method
                 context_method = object.__getattribute__(self, '_get_parameter_with_context')
                 class_default = getattr(self.__class__, name, None)
                 value = context_method(name, class_default)
-                logger.debug(f"DEBUG __getattribute__: {name} = {value} (context-aware)")
+                logger.debug("DEBUG __getattribute__: %s = %s (context-aware)", name, value)
                 return value
             except AttributeError:
                 # Fall back to class attribute if something goes wrong
                 value = getattr(self.__class__, name)
-                logger.debug(f"DEBUG __getattribute__: {name} = {value} (fallback)")
+                logger.debug("DEBUG __getattribute__: %s = %s (fallback)", name, value)
                 return value
         
         # For all other attributes, use normal access
@@ -354,7 +357,7 @@ class Config:
         # TOLERANCE_MULTIPLIER may be overridden on the instance via __getattribute__
         multiplier = getattr(cls.get_instance(), 'TOLERANCE_MULTIPLIER', cls.TOLERANCE_MULTIPLIER)
         tolerance = std_dev * multiplier
-        logger.debug(f"{chrom_name}: std_dev={std_dev:.4f}, tol_mult={multiplier:.3f}, tolerance={tolerance:.4f}")
+        logger.debug("%s: std_dev=%.4f, tol_mult=%.3f, tolerance=%.4f", chrom_name, std_dev, multiplier, tolerance)
         return tolerance
     
     @classmethod
@@ -383,25 +386,26 @@ class Config:
         duplication_min = duplication_target - tolerance
         duplication_max = duplication_target + tolerance
 
-        logger.debug(f"{chrom_name} classification ranges:")
-        logger.debug(f"  Euploid: [{euploid_min:.4f}, {euploid_max:.4f}]")
-        logger.debug(f"  Deletion: [{deletion_min:.4f}, {deletion_max:.4f}]")
-        logger.debug(f"  Duplication: [{duplication_min:.4f}, {duplication_max:.4f}]")
-        logger.debug(f"  Copy number: {copy_number:.4f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{chrom_name} classification ranges:")
+            logger.debug(f"  Euploid: [{euploid_min:.4f}, {euploid_max:.4f}]")
+            logger.debug(f"  Deletion: [{deletion_min:.4f}, {deletion_max:.4f}]")
+            logger.debug(f"  Duplication: [{duplication_min:.4f}, {duplication_max:.4f}]")
+            logger.debug(f"  Copy number: {copy_number:.4f}")
 
         # Check if in euploid range
         if euploid_min <= copy_number <= euploid_max:
-            logger.debug(f"  -> euploid")
+            logger.debug("  -> euploid")
             return 'euploid'
 
         # Check if in aneuploidy ranges
         if (deletion_min <= copy_number <= deletion_max or 
             duplication_min <= copy_number <= duplication_max):
-            logger.debug(f"  -> aneuploidy")
+            logger.debug("  -> aneuploidy")
             return 'aneuploidy'
 
         # Otherwise, it's in the buffer zone
-        logger.debug(f"  -> buffer_zone")
+        logger.debug("  -> buffer_zone")
         return 'buffer_zone'
     
     @classmethod
@@ -569,16 +573,28 @@ class Config:
         """
         logger.debug(f"Saving configuration to file: {filepath}")
         
+        tmp_path = f"{filepath}.tmp"
         try:
             settings = cls.get_all_settings()
-            
-            with open(filepath, 'w') as f:
-                json.dump(settings, f, indent=4)
-            
+
+            # Serialize up front so the file receives a single write rather
+            # than one per token from json.dump.
+            payload = json.dumps(settings, indent=4)
+
+            # Write to a sibling temp file and rename over the target so a
+            # crash mid-write never leaves a truncated configuration behind.
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, filepath)
+
             logger.info(f"Successfully saved configuration to {filepath}")
             return True
-            
+
         except Exception as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             error_msg = f"Error saving settings to {filepath}: {str(e)}"
             logger.error(error_msg)
             logger.debug(f"Error details: {str(e)}", exc_info=True)
@@ -955,20 +971,21 @@ class Config:
             param_name in self._well_parameters[self._well_context]):
             
             value = self._well_parameters[self._well_context][param_name]
-            logger.debug(f"Using well-specific {param_name} = {value} for {self._well_context}")
+            logger.debug("Using well-specific %s = %s for %s", param_name, value, self._well_context)
             return value
         
         # Debug: show what parameters ARE available for this well
-        if self._well_context and self._well_context in self._well_parameters:
-            available_params = list(self._well_parameters[self._well_context].keys())
-            logger.debug(f"Well {self._well_context} has parameters: {available_params}, looking for {param_name}")
-        elif self._well_context:
-            logger.debug(f"Well {self._well_context} has no parameters in context")
+        if logger.isEnabledFor(logging.DEBUG):
+            if self._well_context and self._well_context in self._well_parameters:
+                available_params = list(self._well_parameters[self._well_context].keys())
+                logger.debug(f"Well {self._well_context} has parameters: {available_params}, looking for {param_name}")
+            elif self._well_context:
+                logger.debug(f"Well {self._well_context} has no parameters in context")
         
         # Fall back to class default
         if hasattr(self.__class__, param_name):
             value = getattr(self.__class__, param_name)
-            logger.debug(f"Using default {param_name} = {value}")
+            logger.debug("Using default %s = %s", param_name, value)
             return value
             
         return default_value
@@ -10,6 +10,11 @@ import datetime
 import logging
 import glob
 
+logger = logging.getLogger(__name__)
+
+# Log file location
+LOG_DIR = os.path.join(os.path.expanduser("~"), ".ddquint", "logs")
+
 def cleanup_old_log_files(log_dir, max_files=10):
     """
     Keep only the most recent log files, remove older ones.
@@ -34,14 +39,11 @@ def cleanup_old_log_files(log_dir, max_files=10):
         for old_file in files_to_remove:
             try:
                 os.remove(old_file)
-                logger = logging.getLogger(__name__)
                 logger.debug(f"Removed old log file: {os.path.basename(old_file)}")
             except Exception as e:
-                logger = logging.getLogger(__name__)
                 logger.debug(f"Could not remove old log file {os.path.basename(old_file)}: {e}")
                 
     except Exception as e:
-        logger = logging.getLogger(__name__)
         logger.debug(f"Error during log cleanup: {e}")
 
 def setup_logging(debug=False):
@@ -73,7 +75,7 @@ def setup_logging(debug=False):
         console_log_format = '%(message)s'
     
     # Set up logging to file
-    log_dir = os.path.join(os.path.expanduser("~"), ".ddquint", "logs")
+    log_dir = LOG_DIR
     try:
         os.makedirs(log_dir, exist_ok=True)
     except Exception as e:
@@ -120,9 +122,6 @@ def setup_logging(debug=False):
     for logger_name in matplotlib_loggers:
         logging.getLogger(logger_name).setLevel(logging.WARNING)
     
-    # Configure our specific logger
-    logger = logging.getLogger(__name__)
-    
     if debug:
         logger.debug(f"Debug mode enabled")
         logger.debug(f"Log file: {log_file}")
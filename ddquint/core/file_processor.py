@@ -13,6 +13,7 @@ This module handles all file I/O operations and coordinates the
 analysis pipeline for digital droplet PCR data files.
 """
 
+import io
 import os
 import pandas as pd
 import logging
@@ -62,19 +63,29 @@ def process_csv_file(file_path, graphs_dir, sample_names=None, verbose=False):
         
         logger.debug(f"Processing well {well_coord} from file {basename}")
         
-        # Try to load the CSV file
-        header_row = find_header_row(file_path)
-        if header_row is None:
+        required_cols = ['Ch1Amplitude', 'Ch2Amplitude']
+        
+        # Read the file once, locate the header in the raw bytes and let
+        # pandas parse from the header line onwards
+        with open(file_path, 'rb') as fh:
+            data = fh.read()
+        header = _locate_header(data)
+        if header is None:
             error_msg = f"Could not find header row in {basename}"
             logger.error(error_msg)
             return create_error_result(well_coord, basename, error_msg, graphs_dir, sample_names)
         
-        # Load the CSV data
-        df = pd.read_csv(file_path, skiprows=header_row)
+        header_row, header_offset = header
+        logger.debug(f"Found header row at line {header_row} in {basename}")
+        buffer = io.BytesIO(data)
+        buffer.seek(header_offset)
+        # Only the amplitude columns are used; skip parsing the rest. A
+        # callable keeps a missing column from raising here so the check
+        # below can report it.
+        df = pd.read_csv(buffer, usecols=lambda col: col in required_cols)
         logger.debug(f"Loaded CSV with {len(df)} rows from {basename}")
         
         # Check for required columns
-        required_cols = ['Ch1Amplitude', 'Ch2Amplitude']
         missing_cols = [col for col in required_cols if col not in df.columns]
         
         if missing_cols:
@@ -198,18 +209,52 @@ def find_header_row(file_path):
         FileProcessingError: If file cannot be read
     """
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as fh:
-            for i, line in enumerate(fh):
-                if ('Ch1Amplitude' in line or 'Ch1 Amplitude' in line) and \
-                   ('Ch2Amplitude' in line or 'Ch2 Amplitude' in line):
-                    logger.debug(f"Found header row at line {i} in {os.path.basename(file_path)}")
-                    return i
+        with open(file_path, 'rb') as fh:
+            header = _locate_header(fh.read())
     except Exception as e:
         error_msg = f"Error reading file to find headers: {file_path}"
         logger.error(error_msg)
         logger.debug(f"Error details: {str(e)}", exc_info=True)
         raise FileProcessingError(error_msg, filename=os.path.basename(file_path)) from e
-    return None
+    
+    if header is None:
+        return None
+    logger.debug(f"Found header row at line {header[0]} in {os.path.basename(file_path)}")
+    return header[0]
+
+def _locate_header(data):
+    """
+    Find the amplitude column header line in raw CSV bytes.
+    
+    Uses bytes.find rather than a per-line loop. '\r\n', '\n' and a bare
+    '\r' (Excel for Mac) all count as line ends, matching universal-newline
+    text mode.
+    
+    Args:
+        data: Contents of the CSV file as bytes
+        
+    Returns:
+        Tuple of (row number, byte offset) of the header line, or None if not found
+    """
+    pos = 0
+    while True:
+        hits = [p for p in (data.find(b'Ch1Amplitude', pos), data.find(b'Ch1 Amplitude', pos))
+                if p != -1]
+        if not hits:
+            return None
+        hit = min(hits)
+        
+        # Bounds of the line containing the Ch1 token
+        start = max(data.rfind(b'\n', 0, hit), data.rfind(b'\r', 0, hit)) + 1
+        ends = [p for p in (data.find(b'\n', hit), data.find(b'\r', hit)) if p != -1]
+        end = min(ends) if ends else len(data)
+        
+        line = data[start:end]
+        if b'Ch2Amplitude' in line or b'Ch2 Amplitude' in line:
+            preamble = data[:start]
+            row = preamble.count(b'\n') + preamble.count(b'\r') - preamble.count(b'\r\n')
+            return row, start
+        pos = end
 
 def _extract_partial_clustering_results(clustering_error, df_clean):
     """
@@ -420,7 +465,8 @@ def process_directory(input_dir, output_dir=None, sample_names=None, verbose=Fal
     
     # Find all CSV files in the input directory
     try:
-        csv_files = [f for f in os.listdir(input_dir) if f.lower().endswith('.csv')]
+        with os.scandir(input_dir) as entries:
+            csv_files = [e.name for e in entries if e.name.lower().endswith('.csv') and e.is_file()]
     except Exception as e:
         error_msg = f"Error listing directory contents: {input_dir}"
         logger.error(error_msg)
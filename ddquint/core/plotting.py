@@ -10,12 +10,31 @@ individual plotting.
 import matplotlib.pyplot as plt
 import matplotlib as mpl
 import matplotlib.ticker as ticker
+import numpy as np
+import pandas as pd
+import functools
 import logging
 
 from ..config import Config, VisualizationError
 
 logger = logging.getLogger(__name__)
 
+# Legend order used when Config cannot provide one
+_DEFAULT_ORDERED_LABELS = ('Negative', 'Chrom1', 'Chrom2', 'Chrom3', 'Chrom4', 'Chrom5')
+
+# Labels that never get a copy number annotation
+_NON_TARGET_LABELS = frozenset(('Negative', 'Unknown'))
+
+# Copy number states whose annotation is drawn in bold
+_EMPHASIZED_STATES = frozenset(('aneuploidy', 'buffer_zone'))
+
+# PNG encoder settings: zlib level 1 is several times faster than the
+# default level 6 for flat-colored plots at a modest size cost
+_PNG_SAVE_OPTIONS = {'compress_level': 1, 'optimize': False}
+
+# (fig, ax, figsize) reused across well plots; rebuilt when the size changes
+_WELL_FIGURE = None
+
 
 def create_well_plot(df, clustering_results, well_id, save_path,
                     add_copy_numbers=True, sample_name=None):
@@ -27,18 +46,22 @@ def create_well_plot(df, clustering_results, well_id, save_path,
       - Always include 'Unclustered' in legend if raw data was plotted
     """
     config = Config.get_instance()
-    logger.debug(f"Creating well plot for {well_id}")
+    logger.debug("Creating well plot for %s", well_id)
 
     try:
-        fig, ax = _create_base_plot(config)
+        fig, ax = _get_well_figure(config)
         _apply_axis_formatting(ax, config)
 
+        # TARGET_COLORS is resolved through the well context on every access,
+        # so read it once for the whole plot
+        target_colors = config.TARGET_COLORS
+
         # Track whether we plot unclustered so legend can include it
         plotted_unclustered = False
 
         # 1) Plot raw droplets as 'Unclustered' when df is available
         if df is not None and not df.empty:
-            _add_raw_data_content(ax, df)
+            _add_raw_data_content(ax, df, target_colors)
             plotted_unclustered = True
 
         # 2) Overlay clustered/filtered droplets if available and valid
@@ -51,35 +74,34 @@ def create_well_plot(df, clustering_results, well_id, save_path,
 
             if df_filtered is not None and hasattr(df_filtered, 'empty') and not df_filtered.empty:
                 # Overlay filtered points using TargetLabel; do not require target_mapping
-                label_color_map = dict(config.TARGET_COLORS or {})
-                df_filtered_copy = df_filtered.copy()
+                # Only read from here on, so no defensive copy is needed
+                label_color_map = target_colors or {}
                 unknown_color = label_color_map.get('Unknown', '#c7c7c7')
                 # Split unknown vs others
-                is_unknown = df_filtered_copy['TargetLabel'] == 'Unknown'
-                df_known = df_filtered_copy[~is_unknown]
-                df_unknown = df_filtered_copy[is_unknown]
+                is_unknown = df_filtered['TargetLabel'] == 'Unknown'
+                df_known = df_filtered[~is_unknown]
+                df_unknown = df_filtered[is_unknown]
                 if not df_known.empty:
-                    colors_known = df_known['TargetLabel'].map(label_color_map).fillna(unknown_color).astype(str).tolist()
+                    colors_known = _label_colors(df_known['TargetLabel'], label_color_map, unknown_color)
                     ax.scatter(df_known['Ch2Amplitude'], df_known['Ch1Amplitude'], c=colors_known, s=8, alpha=0.6)
                 if not df_unknown.empty:
                     ax.scatter(df_unknown['Ch2Amplitude'], df_unknown['Ch1Amplitude'], c=unknown_color, s=6, alpha=0.5)
 
                 # Copy number annotations when requested
                 if add_copy_numbers and copy_numbers:
-                    _add_copy_number_annotations(ax, df_filtered_copy, copy_numbers, copy_number_states, label_color_map)
+                    _add_copy_number_annotations(ax, df_filtered, copy_numbers, copy_number_states, label_color_map)
 
             # 3) Legend: targets + Unclustered when raw was plotted
-            label_color_map = config.TARGET_COLORS
-            _add_legend(ax, label_color_map, counts, has_unclustered=plotted_unclustered)
+            _add_legend(ax, target_colors, counts, has_unclustered=plotted_unclustered)
         except Exception as e:
             logger.debug(f"Overlay/legend section failed: {e}", exc_info=True)
 
         _set_plot_labels_and_title(ax, well_id, sample_name)
 
         dpi = config.get_plot_dpi('individual')
-        plt.savefig(save_path, dpi=dpi, bbox_inches='tight', pad_inches=0.1)
-        plt.close(fig)
-        logger.debug(f"Well plot saved to: {save_path} (DPI: {dpi})")
+        fig.savefig(save_path, dpi=dpi, bbox_inches='tight', pad_inches=0.1,
+                    pil_kwargs=_PNG_SAVE_OPTIONS)
+        logger.debug("Well plot saved to: %s (DPI: %s)", save_path, dpi)
         return save_path
     except Exception as e:
         logger.error(f"Error creating well plot for {well_id}: {e}")
@@ -95,6 +117,53 @@ def _create_base_plot(config):
     return fig, ax
 
 
+def _get_well_figure(config):
+    """
+    Get a cleared figure and axes for an individual well plot.
+
+    Building a figure and axes is a large share of the cost of a well plot,
+    so the previous pair is cleared and reused while the configured size
+    stays the same.
+    """
+    global _WELL_FIGURE
+    fig_size = tuple(config.get_plot_dimensions())
+    if _WELL_FIGURE is not None:
+        fig, ax, cached_size = _WELL_FIGURE
+        if cached_size == fig_size and plt.fignum_exists(fig.number):
+            ax.cla()
+            return fig, ax
+        plt.close(fig)
+    fig, ax = _create_base_plot(config)
+    _WELL_FIGURE = (fig, ax, fig_size)
+    return fig, ax
+
+
+def _label_colors(labels, label_color_map, unknown_color):
+    """
+    Resolve per-droplet RGBA colors for a Series of target labels.
+
+    Labels are converted to categorical codes and used to index a small
+    palette, so each color string is parsed once rather than once per droplet.
+    Labels missing from the map (code -1) pick up the trailing unknown color.
+    """
+    color_items = tuple(label_color_map.items())
+    palette = _rgba_palette(color_items, unknown_color)
+    codes = pd.Categorical(labels, categories=[label for label, _ in color_items]).codes
+    return palette[codes]
+
+
+@functools.lru_cache(maxsize=16)
+def _rgba_palette(color_items, unknown_color):
+    """Build the RGBA palette for (label, color) pairs plus a trailing unknown color."""
+    palette = np.array(
+        [mpl.colors.to_rgba(color or unknown_color) for _, color in color_items]
+        + [mpl.colors.to_rgba(unknown_color)]
+    )
+    # Shared between calls, so guard against accidental in-place edits
+    palette.setflags(write=False)
+    return palette
+
+
 def _apply_axis_formatting(ax, config, border_color='#B0B0B0'):
     """Apply consistent axis formatting."""
     axis_limits = config.get_axis_limits()
@@ -111,106 +180,27 @@ def _apply_axis_formatting(ax, config, border_color='#B0B0B0'):
         spine.set_color(border_color)
 
 
-def _is_error_result(clustering_results):
-    return clustering_results.get('error') is not None
-
-
-def _has_insufficient_data(df, clustering_results, config):
-    # Deprecated: we always plot what we have (raw + filtered overlay when available)
-    return False
-
-
-def _validate_clustering_data(clustering_results):
-    return (
-        'df_filtered' in clustering_results and clustering_results['df_filtered'] is not None and
-        not clustering_results['df_filtered'].empty and
-        'target_mapping' in clustering_results and clustering_results['target_mapping'] is not None
-    )
-
-
-def _add_raw_data_with_error(ax, df, clustering_results, well_id):
-    df_filtered = clustering_results.get('df_filtered')
-    target_mapping = clustering_results.get('target_mapping')
-    label_color_map = Config.get_instance().TARGET_COLORS
-
-    if df_filtered is not None and not df_filtered.empty:
-        logger.debug(f"Plotting {len(df_filtered)} clustered droplets for well {well_id} with error context")
-        df_filtered_copy = df_filtered.copy()
-        # Split unknown vs others for consistent styling
-        unknown_color = label_color_map.get('Unknown', '#c7c7c7')
-        is_unknown = df_filtered_copy['TargetLabel'] == 'Unknown'
-        df_known = df_filtered_copy[~is_unknown]
-        df_unknown = df_filtered_copy[is_unknown]
-        if not df_known.empty:
-            colors_known = df_known['TargetLabel'].map(label_color_map).fillna(unknown_color).astype(str).tolist()
-            ax.scatter(df_known['Ch2Amplitude'], df_known['Ch1Amplitude'], c=colors_known, s=8, alpha=0.6)
-        if not df_unknown.empty:
-            ax.scatter(df_unknown['Ch2Amplitude'], df_unknown['Ch1Amplitude'], c=unknown_color, s=6, alpha=0.5)
-        counts = clustering_results.get('counts', {})
-        _add_legend(ax, label_color_map, counts)
-    else:
-        unknown_color = Config.get_instance().TARGET_COLORS.get('Unknown', '#c7c7c7')
-        ax.scatter(df['Ch2Amplitude'], df['Ch1Amplitude'], c=unknown_color, s=8, alpha=0.6)
-
-
-def _add_raw_data_content(ax, df):
-    unknown_color = Config.get_instance().TARGET_COLORS.get('Unknown', '#c7c7c7')
+def _add_raw_data_content(ax, df, label_color_map):
+    unknown_color = label_color_map.get('Unknown', '#c7c7c7')
     # Plot raw droplets with the same styling as 'Unknown' (s=6, alpha=0.5)
     ax.scatter(df['Ch2Amplitude'], df['Ch1Amplitude'], c=unknown_color, s=6, alpha=0.5)
 
 
-def _add_data_content(ax, df, clustering_results, well_id, add_copy_numbers, sample_name, config):
-    df_filtered = clustering_results['df_filtered']
-    counts = clustering_results['counts']
-    copy_numbers = clustering_results['copy_numbers']
-    label_color_map = config.TARGET_COLORS
-
-    logger.debug(f"Plotting {len(df_filtered)} filtered droplets for well {well_id}")
-
-    clustered_indices = set(df_filtered.index)
-    # Be robust: if df is None or empty, skip; else compute unclustered
-    df_unclustered = df[~df.index.isin(clustered_indices)] if df is not None and not df.empty else None
-
-    unknown_color = label_color_map.get('Unknown', '#c7c7c7')
-    if df_unclustered is not None and not df_unclustered.empty:
-        ax.scatter(df_unclustered['Ch2Amplitude'], df_unclustered['Ch1Amplitude'],
-                   c=unknown_color, s=6, alpha=0.5)
-
-    df_filtered_copy = df_filtered.copy()
-    df_filtered_copy['color'] = df_filtered_copy['TargetLabel'].map(label_color_map)
-    colors = df_filtered_copy['color'].fillna(label_color_map.get('Unknown', '#c7c7c7')).astype(str).tolist()
-    ax.scatter(df_filtered_copy['Ch2Amplitude'], df_filtered_copy['Ch1Amplitude'], c=colors, s=8, alpha=0.6)
-
-    # Fallback: if everything above produced no visible points and raw df exists, plot raw to avoid empty plot
-    try:
-        if (df_unclustered is None or df_unclustered.empty) and df is not None and not df.empty and df_filtered_copy.empty:
-            ax.scatter(df['Ch2Amplitude'], df['Ch1Amplitude'], c=unknown_color, s=6, alpha=0.5)
-    except Exception:
-        pass
-
-    if add_copy_numbers and copy_numbers:
-        _add_copy_number_annotations(ax, df_filtered_copy, copy_numbers,
-                                     clustering_results.get('copy_number_states', {}),
-                                     label_color_map)
-
-    _add_legend(ax, label_color_map, counts, has_unclustered=(not df_unclustered.empty))
-
-
 def _add_copy_number_annotations(ax, df_filtered, copy_numbers, copy_number_states, label_color_map):
     logger.debug("Adding copy number annotations")
     from .copy_number import apply_copy_number_display_multiplier
     display_copy_numbers = apply_copy_number_display_multiplier(copy_numbers)
+    # One grouped pass for all cluster centroids instead of a mask per target
+    centroids = df_filtered.groupby('TargetLabel', sort=False)[['Ch2Amplitude', 'Ch1Amplitude']].mean()
     for target, color in label_color_map.items():
-        if target not in ['Negative', 'Unknown'] and target in copy_numbers:
-            target_points = df_filtered[df_filtered['TargetLabel'] == target]
-            if not target_points.empty:
-                cx = target_points['Ch2Amplitude'].mean()
-                cy = target_points['Ch1Amplitude'].mean()
+        if target not in _NON_TARGET_LABELS and target in copy_numbers:
+            if target in centroids.index:
+                cx, cy = centroids.loc[target]
                 cn_value = display_copy_numbers[target]
                 cn_text = f"{cn_value:.2f}"
                 state = copy_number_states.get(target, 'euploid')
                 font_size = 12
-                font_weight = 'bold' if state in ['aneuploidy', 'buffer_zone'] else 'normal'
+                font_weight = 'bold' if state in _EMPHASIZED_STATES else 'normal'
                 if state == 'aneuploidy':
                     text_color = 'darkred'
                 elif state == 'buffer_zone':
@@ -223,20 +213,28 @@ def _add_copy_number_annotations(ax, df_filtered, copy_numbers, copy_number_stat
 
 
 def _add_legend(ax, label_color_map, counts, has_unclustered=False):
-    from ..config import Config
     try:
         ordered_labels = Config.get_ordered_labels()
     except Exception:
-        ordered_labels = ['Negative', 'Chrom1', 'Chrom2', 'Chrom3', 'Chrom4', 'Chrom5']
+        ordered_labels = _DEFAULT_ORDERED_LABELS
+
+    # Look up custom target names once rather than once per legend entry
+    try:
+        target_names = Config.get_target_names()
+        target_names_error = False
+    except Exception:
+        target_names = None
+        target_names_error = True
 
     def get_display_name(internal_name):
         if internal_name in ('Negative', 'Unknown', 'Unclustered'):
             return internal_name
         if internal_name.startswith('Chrom'):
+            if target_names_error:
+                return internal_name
             try:
                 chrom_num = internal_name[5:]
                 target_key = f'Target{chrom_num}'
-                target_names = Config.get_target_names()
                 if target_names and target_key in target_names and target_names[target_key].strip():
                     return target_names[target_key].strip()
                 return target_key
@@ -244,15 +242,13 @@ def _add_legend(ax, label_color_map, counts, has_unclustered=False):
                 return internal_name
         return internal_name
 
-    legend_handles = []
-    for tgt in ordered_labels:
-        if tgt not in counts or counts[tgt] == 0 or tgt == 'Unknown':
-            continue
-        color = label_color_map[tgt]
-        display_name = get_display_name(tgt)
-        handle = mpl.lines.Line2D([], [], marker='o', linestyle='', markersize=10,
-                                  markerfacecolor=color, markeredgecolor='none', label=display_name)
-        legend_handles.append(handle)
+    legend_handles = [
+        mpl.lines.Line2D([], [], marker='o', linestyle='', markersize=10,
+                         markerfacecolor=label_color_map[tgt], markeredgecolor='none',
+                         label=get_display_name(tgt))
+        for tgt in ordered_labels
+        if tgt != 'Unknown' and counts.get(tgt, 0) != 0
+    ]
 
     # Include 'Unclustered' legend entry if raw was plotted or Unknown counts exist
     include_unclustered = has_unclustered or (counts.get('Unknown', 0) > 0)
@@ -277,12 +273,13 @@ def _set_plot_labels_and_title(ax, well_id, sample_name):
 def create_placeholder_plot(well_id, save_path):
     """Create a placeholder plot."""
     config = Config.get_instance()
-    logger.debug(f"Creating placeholder plot for {well_id}")
+    logger.debug("Creating placeholder plot for %s", well_id)
     try:
         fig, ax = _create_base_plot(config)
         _apply_axis_formatting(ax, config)
         dpi = config.get_plot_dpi('placeholder')
-        plt.savefig(save_path, dpi=dpi, bbox_inches='tight', pad_inches=0.1)
+        plt.savefig(save_path, dpi=dpi, bbox_inches='tight', pad_inches=0.1,
+                    pil_kwargs=_PNG_SAVE_OPTIONS)
         plt.close(fig)
         return save_path
     except Exception as e:
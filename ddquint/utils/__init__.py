@@ -17,7 +17,8 @@ from .template_parser import (
     find_template_file,
     find_header_row,
     parse_template_file,
-    get_sample_names
+    get_sample_names,
+    get_sample_names_batch
 )
 
 from .template_creator import (
@@ -48,6 +49,7 @@ __all__ = [
     'find_header_row',
     'parse_template_file',
     'get_sample_names',
+    'get_sample_names_batch',
     'create_template_from_file',
 
     # Parameter editor
@@ -30,19 +30,16 @@ def ensure_directory(directory):
         FileProcessingError: If directory creation fails
     """
     logger.debug(f"Ensuring directory exists: {directory}")
-    
-    if not os.path.exists(directory):
-        try:
-            os.makedirs(directory, exist_ok=True)
-            logger.debug(f"Created directory: {directory}")
-        except Exception as e:
-            error_msg = f"Error creating directory {directory}: {str(e)}"
-            logger.error(error_msg)
-            logger.debug(f"Error details: {str(e)}", exc_info=True)
-            raise FileProcessingError(error_msg) from e
-    else:
-        logger.debug(f"Directory already exists: {directory}")
-    
+
+    # exist_ok makes makedirs idempotent, so no separate existence probe is needed
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except Exception as e:
+        error_msg = f"Error creating directory {directory}: {str(e)}"
+        logger.error(error_msg)
+        logger.debug(f"Error details: {str(e)}", exc_info=True)
+        raise FileProcessingError(error_msg) from e
+
     return directory
 
 
@@ -67,11 +64,14 @@ def list_csv_files(directory):
         raise FileProcessingError(error_msg)
     
     try:
-        files = [
-            os.path.join(directory, f) 
-            for f in os.listdir(directory) 
-            if f.lower().endswith('.csv')
-        ]
+        # scandir yields file type with each entry, so directories that happen
+        # to end in .csv are skipped without an extra stat per name
+        with os.scandir(directory) as entries:
+            files = [
+                entry.path
+                for entry in entries
+                if entry.name.lower().endswith('.csv') and entry.is_file()
+            ]
         logger.debug(f"Found {len(files)} CSV files in {directory}")
         
         if logger.isEnabledFor(logging.DEBUG):
@@ -107,11 +107,6 @@ def find_header_row(file_path, header_keywords=None):
     logger.debug(f"Finding header row in {os.path.basename(file_path)}")
     logger.debug(f"Looking for keywords: {header_keywords}")
     
-    if not os.path.exists(file_path):
-        error_msg = f"File does not exist: {file_path}"
-        logger.error(error_msg)
-        raise FileProcessingError(error_msg)
-    
     try:
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
             for i, line in enumerate(f):
@@ -123,6 +118,11 @@ def find_header_row(file_path, header_keywords=None):
         logger.debug("Header row not found")
         return None
         
+    except FileNotFoundError as e:
+        # Let open() report a missing file instead of probing with a separate stat
+        error_msg = f"File does not exist: {file_path}"
+        logger.error(error_msg)
+        raise FileProcessingError(error_msg) from e
     except Exception as e:
         error_msg = f"Error reading file {os.path.basename(file_path)}: {str(e)}"
         logger.error(error_msg)
@@ -13,6 +13,7 @@ Parameter Priority Order:
 """
 
 import os
+import copy
 import json
 import sys
 import logging
@@ -25,6 +26,39 @@ logger = logging.getLogger(__name__)
 USER_SETTINGS_DIR = os.path.join(os.path.expanduser("~"), ".ddquint")
 PARAMETERS_FILE = os.path.join(USER_SETTINGS_DIR, "parameters.json")
 
+# Parsed parameters keyed by (path, mtime_ns, size) of the file they came from
+_PARAMS_CACHE = {}
+
+# Sentinel for config attributes that do not exist
+_MISSING = object()
+
+
+def _read_parameters(path=None):
+    """
+    Read and parse a parameters file, reusing the last parse if unchanged.
+    
+    Args:
+        path: Path to the parameters JSON file (defaults to PARAMETERS_FILE)
+        
+    Returns:
+        Dictionary of parameters (a private copy the caller may modify)
+        
+    Raises:
+        FileNotFoundError: If the parameters file does not exist
+        ValueError: If the file is not valid JSON
+    """
+    path = PARAMETERS_FILE if path is None else path
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    cached = _PARAMS_CACHE.get(path)
+    if cached is None or cached[0] != key:
+        with open(path, 'r') as f:
+            cached = (key, json.load(f))
+        _PARAMS_CACHE[path] = cached
+    else:
+        logger.debug("Using cached parameters for %s", path)
+    return copy.deepcopy(cached[1])
+
 
 def open_parameter_editor(config_cls):
     """
@@ -66,13 +100,11 @@ def console_parameter_editor(config_cls):
     
     # Load existing parameters if they exist
     try:
-        if os.path.exists(PARAMETERS_FILE):
-            with open(PARAMETERS_FILE, 'r') as f:
-                parameters = json.load(f)
-            print(f"\nLoaded {len(parameters)} existing parameters from {PARAMETERS_FILE}")
-        else:
-            parameters = {}
-            print(f"\nNo existing parameters found at {PARAMETERS_FILE}")
+        parameters = _read_parameters()
+        print(f"\nLoaded {len(parameters)} existing parameters from {PARAMETERS_FILE}")
+    except FileNotFoundError:
+        parameters = {}
+        print(f"\nNo existing parameters found at {PARAMETERS_FILE}")
     except Exception as e:
         logger.error(f"Error loading parameters: {e}")
         parameters = {}
@@ -83,43 +115,51 @@ def console_parameter_editor(config_cls):
     return False  # Console editor doesn't save - use macOS app instead
 
 
-def apply_parameters_to_config(config_cls):
+def apply_parameters_to_config(config_cls, parameters=None):
     """
     Apply saved parameters to a config instance.
     
     Args:
         config_cls: The Config class to apply parameters to
+        parameters: Parameters already in memory (e.g. just saved); when
+            given, the parameters file is not read
+        
+    Returns:
+        True if parameters were read or supplied, False otherwise
     """
     logger.debug("Applying saved parameters to config")
     
-    # Load parameters file
-    parameters = {}
-    try:
-        if os.path.exists(PARAMETERS_FILE):
-            with open(PARAMETERS_FILE, 'r') as f:
-                parameters = json.load(f)
-                logger.info(f"Loaded {len(parameters)} parameters from file")
-        else:
+    if parameters is None:
+        # Load parameters file
+        try:
+            parameters = _read_parameters()
+            logger.info(f"Loaded {len(parameters)} parameters from file")
+        except FileNotFoundError:
             logger.debug("No parameters file found")
-            return
-    except Exception as e:
-        logger.error(f"Error loading parameters file: {e}")
-        return
+            return False
+        except Exception as e:
+            logger.error(f"Error loading parameters file: {e}")
+            return False
     
-    # Apply parameters to config
+    # Apply parameters to config, only writing attributes whose value differs
     applied_count = 0
+    changed_count = 0
     for key, value in parameters.items():
         try:
-            if hasattr(config_cls, key):
-                setattr(config_cls, key, value)
-                applied_count += 1
-                logger.debug(f"Applied parameter {key} = {value}")
-            else:
+            current = getattr(config_cls, key, _MISSING)
+            if current is _MISSING:
                 logger.warning(f"Unknown parameter: {key}")
+                continue
+            applied_count += 1
+            if current != value:
+                setattr(config_cls, key, value)
+                changed_count += 1
+                logger.debug("Applied parameter %s = %r", key, value)
         except Exception as e:
             logger.error(f"Error applying parameter {key}: {e}")
     
-    logger.info(f"Applied {applied_count} parameters to config")
+    logger.info(f"Applied {applied_count} parameters to config ({changed_count} changed)")
+    return True
 
 
 def load_parameters_if_exist(config_cls):
@@ -132,8 +172,9 @@ def load_parameters_if_exist(config_cls):
     Returns:
         True if parameters were loaded and applied, False otherwise
     """
-    if parameters_exist():
-        apply_parameters_to_config(config_cls)
+    # apply_parameters_to_config already stats the file, so let it report
+    # whether one was found instead of checking existence beforehand
+    if apply_parameters_to_config(config_cls):
         logger.info("Parameters loaded and applied successfully")
         return True
     else:
@@ -169,10 +210,10 @@ def delete_parameters():
         True if file was deleted successfully
     """
     try:
-        if os.path.exists(PARAMETERS_FILE):
-            os.remove(PARAMETERS_FILE)
-            logger.info("Parameters file deleted")
-            return True
+        os.remove(PARAMETERS_FILE)
+        logger.info("Parameters file deleted")
+        return True
+    except FileNotFoundError:
         return False
     except Exception as e:
         logger.error(f"Error deleting parameters file: {e}")
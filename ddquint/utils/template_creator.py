@@ -13,11 +13,18 @@ import logging
 import re
 import datetime
 import csv
-from send2trash import send2trash
 from ..config import FileProcessingError
 
 logger = logging.getLogger(__name__)
 
+# (well_id, data_idx) for every well in plate write order (row-major),
+# where data_idx is the column-major position of the sample in the input list
+_PLATE_WELL_ORDER = tuple(
+    (f"{row_letter}{col_num:02d}", (col_num - 1) * 8 + row_idx)
+    for row_idx, row_letter in enumerate('ABCDEFGH')
+    for col_num in range(1, 13)
+)
+
 def create_template_from_file(input_file_path):
     """
     Main function to process an input file and generate the filled template.
@@ -61,17 +68,25 @@ def create_template_from_file(input_file_path):
             f"Number of samples is not a multiple of 8. Some wells in the final column will be empty.\n"
         )
 
-    # Save the template file
+    # Save the template file via a temp file in the same directory so an
+    # existing template is only replaced once the new one is complete
+    tmp_file = f"{output_file_path}.tmp"
     try:
-        with open(output_file_path, 'w', newline='') as f:
+        with open(tmp_file, 'w', newline='') as f:
             writer = csv.writer(f)
             writer.writerows(output_lines)
+        os.replace(tmp_file, output_file_path)
         logger.info(f"Template successfully saved to: {output_file_path}")
     except IOError as e:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
         raise FileProcessingError(f"Failed to write output template file: {e}", filename=output_file_path) from e
 
     # Always move the original input file to trash if processing was successful
     try:
+        from send2trash import send2trash  # Only needed once a template was written
         send2trash(input_file_path)
         logger.debug(f"Moved processed input file to trash: {input_file_path}")
     except Exception as e:
@@ -109,26 +124,21 @@ def _read_input_file(file_path):
 def _fill_plate_wells(output_lines, df):
     """Fills the 96 wells of the plate with sample data."""
     total_rows = len(df)
-    for row_letter in 'ABCDEFGH':
-        for col_num in range(1, 13):
-            well_id = f"{row_letter}{col_num:02d}"
-            # Column-major mapping: data_idx = (col-1) * 8 + (row_letter_index)
-            data_idx = (col_num - 1) * 8 + (ord(row_letter) - ord('A'))
-
-            if data_idx < total_rows:
-                sample_data = df.iloc[data_idx]
-                sample_desc_1 = sample_data.get('Sample description 1', sample_data.iloc[0] if len(sample_data) > 0 else "")
-                additional_desc = [
-                    sample_data.get('Sample description 2', sample_data.iloc[1] if len(sample_data) > 1 else ""),
-                    sample_data.get('Sample description 3', sample_data.iloc[2] if len(sample_data) > 2 else ""),
-                    sample_data.get('Sample description 4', sample_data.iloc[3] if len(sample_data) > 3 else "")
-                ]
-                control_type = _detect_control_type(sample_desc_1)
-                output_lines.extend(
-                    _get_template_rows_for_well(well_id, sample_desc_1, additional_desc, control_type)
-                )
-            else:
-                output_lines.append(_get_empty_template_row(well_id))
+    for well_id, data_idx in _PLATE_WELL_ORDER:
+        if data_idx < total_rows:
+            sample_data = df.iloc[data_idx]
+            sample_desc_1 = sample_data.get('Sample description 1', sample_data.iloc[0] if len(sample_data) > 0 else "")
+            additional_desc = [
+                sample_data.get('Sample description 2', sample_data.iloc[1] if len(sample_data) > 1 else ""),
+                sample_data.get('Sample description 3', sample_data.iloc[2] if len(sample_data) > 2 else ""),
+                sample_data.get('Sample description 4', sample_data.iloc[3] if len(sample_data) > 3 else "")
+            ]
+            control_type = _detect_control_type(sample_desc_1)
+            output_lines.extend(
+                _get_template_rows_for_well(well_id, sample_desc_1, additional_desc, control_type)
+            )
+        else:
+            output_lines.append(_get_empty_template_row(well_id))
 
 def _create_template_header():
     """Create the header lines for the template file."""
@@ -11,12 +11,17 @@ extracts sample descriptions with proper error handling.
 import os
 import csv
 import time
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 from ..config import Config, FileProcessingError, TemplateError
 
 logger = logging.getLogger(__name__)
 
+# Directories that never hold plate templates; pruned from the template search
+_SKIP_SEARCH_DIRS = frozenset({'__pycache__', 'node_modules', 'venv'})
+
 
 def find_template_file(input_dir):
     """
@@ -43,8 +48,8 @@ def find_template_file(input_dir):
     dir_name = os.path.basename(input_dir)
     template_name = f"{dir_name}.csv"
     
-    logger.debug(f"Looking for template file: {template_name}")
-    logger.debug(f"Input directory: {input_dir}")
+    logger.debug("Looking for template file: %s", template_name)
+    logger.debug("Input directory: %s", input_dir)
     
     # Go up configured number of parent directories
     try:
@@ -53,17 +58,21 @@ def find_template_file(input_dir):
             current_dir = os.path.dirname(current_dir)
         
         parent_dir = current_dir
-        logger.debug(f"Searching in parent directory ({config.TEMPLATE_SEARCH_PARENT_LEVELS} levels up): {parent_dir}")
+        logger.debug("Searching in parent directory (%s levels up): %s",
+                     config.TEMPLATE_SEARCH_PARENT_LEVELS, parent_dir)
         
         # Search in all subdirectories
-        for root, dirs, files in os.walk(parent_dir):
-            for file in files:
-                if file == template_name:
-                    template_path = os.path.join(root, file)
-                    logger.debug(f"Template file found: {template_path}")
-                    return template_path
+        # Membership test on each listing is done in C and the walk stops at
+        # the first directory that contains the template
+        for root, dirs, files in os.walk(parent_dir, topdown=True):
+            if template_name in files:
+                template_path = os.path.join(root, template_name)
+                logger.debug("Template file found: %s", template_path)
+                return template_path
+            # Don't descend into hidden or tooling directories
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in _SKIP_SEARCH_DIRS]
         
-        logger.debug(f"Template file {template_name} not found")
+        logger.debug("Template file %s not found", template_name)
         return None
         
     except Exception as e:
@@ -85,28 +94,28 @@ def find_header_row(file_path):
     Raises:
         FileProcessingError: If file cannot be read after retries
     """
-    if not os.path.exists(file_path):
-        error_msg = f"Template file does not exist: {file_path}"
-        logger.error(error_msg)
-        raise FileProcessingError(error_msg)
-    
     max_retries = 3
     retry_delay = 0.5
     
     for attempt in range(max_retries):
         try:
             with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
-                lines = csvfile.readlines()
-                
-                for row_num, line in enumerate(lines):
+                # Iterate the file lazily so the scan stops at the header
+                # instead of buffering the whole template first
+                for row_num, line in enumerate(csvfile):
                     # Check if this line contains 'Well' column
                     if 'Well,' in line:
-                        logger.debug(f"Found 'Well' header in row {row_num}")
+                        logger.debug("Found 'Well' header in row %d", row_num)
                         return row_num
                         
             logger.debug("'Well' header not found in template file")
             return -1
             
+        except FileNotFoundError as e:
+            # A missing file will not appear on retry; report it without a separate stat
+            error_msg = f"Template file does not exist: {file_path}"
+            logger.error(error_msg)
+            raise FileProcessingError(error_msg) from e
         except (PermissionError, OSError) as e:
             if attempt < max_retries - 1:
                 logger.debug(f"Template file access failed on attempt {attempt + 1}, retrying in {retry_delay}s: {str(e)}")
@@ -139,7 +148,7 @@ def parse_template_file(template_path, description_count=None):
         TemplateError: If template parsing fails
         FileProcessingError: If template file cannot be read
     """
-    logger.debug(f"Parsing template file: {os.path.basename(template_path)}")
+    logger.debug("Parsing template file: %s", os.path.basename(template_path))
     
     well_to_name = {}
     # Determine how many Sample description columns to use (1-4)
@@ -159,77 +168,86 @@ def parse_template_file(template_path, description_count=None):
     
     for attempt in range(max_retries):
         try:
-            # First, find which row contains the headers
-            header_row = find_header_row(template_path)
-            
-            if header_row == -1:
-                error_msg = f"Could not find header row in template file: {os.path.basename(template_path)}"
-                logger.error(error_msg)
-                raise TemplateError(error_msg)
-            
-            logger.debug(f"Header row found at index: {header_row}")
-            
-            # Read the file, skipping to the header row
             with open(template_path, 'r', newline='', encoding='utf-8') as csvfile:
-                # Skip rows before the header
-                for _ in range(header_row):
-                    next(csvfile)
+                # Locate the header row and parse from the same open file
+                # rather than scanning it once and reopening it to read rows
+                header_row = -1
+                for row_num, line in enumerate(csvfile):
+                    if 'Well,' in line:
+                        header_row = row_num
+                        break
+                
+                if header_row == -1:
+                    error_msg = f"Could not find header row in template file: {os.path.basename(template_path)}"
+                    logger.error(error_msg)
+                    raise TemplateError(error_msg)
+                
+                logger.debug("Header row found at index: %d", header_row)
                 
                 # Create reader starting from header row
-                reader = csv.DictReader(csvfile)
+                # Plain csv.reader with column positions resolved once from the
+                # header avoids building a dict for every template row
+                reader = csv.reader(itertools.chain((line,), csvfile))
+                header = next(reader, [])
                 
                 # Check for required columns
                 required_columns = ['Well', 'Sample description 1', 'Sample description 2', 
                                   'Sample description 3', 'Sample description 4']
                 
-                if not reader.fieldnames:
+                if not header:
                     error_msg = f"No fieldnames found in template file: {os.path.basename(template_path)}"
                     logger.error(error_msg)
                     raise TemplateError(error_msg)
                 
+                # Later duplicates win, matching csv.DictReader
+                field_idx = {name: i for i, name in enumerate(header)}
+                
                 missing_columns = []
                 for col in required_columns:
-                    if col not in reader.fieldnames:
+                    if col not in field_idx:
                         missing_columns.append(col)
                         logger.warning(f"Column '{col}' not found in template")
                 
                 if missing_columns:
                     logger.warning(f"Missing columns: {missing_columns}")
-                    logger.debug(f"Available columns: {reader.fieldnames}")
+                    logger.debug("Available columns: %s", header)
                 
-                # Process each row
-                for row_num, row in enumerate(reader, start=header_row + 2):
-                    well_id = row.get('Well', '').strip()
-                    
-                    # Skip empty wells
+                well_i = field_idx.get('Well')
+                desc_idx = [field_idx[f'Sample description {i}'] for i in range(1, desc_count + 1)
+                            if f'Sample description {i}' in field_idx]
+                
+                # Process each row (none can map to a well without a Well column)
+                for row in (reader if well_i is not None else ()):
+                    # Skip blank rows and empty wells before touching descriptions
+                    row_len = len(row)
+                    if well_i >= row_len:
+                        continue
+                    well_id = row[well_i].strip()
                     if not well_id:
                         continue
                     
-                    # Combine Sample description columns with " - " separator
-                    sample_description_parts = []
-                    for i in range(1, desc_count + 1):
-                        part = row.get(f'Sample description {i}', '').strip()
-                        if part:  # Only add non-empty parts
-                            sample_description_parts.append(part)
+                    # Combine non-empty Sample description columns with " - " separator
+                    sample_name = ' - '.join(filter(None, (row[i].strip() for i in desc_idx if i < row_len)))
                     
-                    if sample_description_parts:
-                        sample_name = ' - '.join(sample_description_parts)
-                        
+                    if sample_name:
                         # Check for duplicate well IDs with different names
                         if well_id in well_to_name and well_to_name[well_id] != sample_name:
                             logger.warning(f"Multiple descriptions for well {well_id}: "
                                            f"'{well_to_name[well_id]}' vs '{sample_name}'")
                         else:
                             well_to_name[well_id] = sample_name
-                    else:
-                        continue
             
-            logger.debug(f"Finished parsing template. Found {len(well_to_name)} unique well-sample mappings")
+            logger.debug("Finished parsing template. Found %d unique well-sample mappings", len(well_to_name))
             return well_to_name
             
         except (TemplateError, FileProcessingError):
             # Re-raise template and file processing errors as-is
             raise
+        except FileNotFoundError as e:
+            # A missing file will not appear on retry
+            error_msg = f"Template file does not exist: {template_path}"
+            logger.error(error_msg)
+            raise FileProcessingError(error_msg) from e
         except (PermissionError, OSError) as e:
             if attempt < max_retries - 1:
                 logger.debug(f"Template file access failed on attempt {attempt + 1}, retrying in {retry_delay}s: {str(e)}")
@@ -261,7 +279,7 @@ def get_sample_names(input_dir):
     Raises:
         FileProcessingError: If input directory is invalid
     """
-    logger.debug(f"Getting sample names for directory: {os.path.basename(input_dir)}")
+    logger.debug("Getting sample names for directory: %s", os.path.basename(input_dir))
     
     if not os.path.exists(input_dir):
         error_msg = f"Input directory does not exist: {input_dir}"
@@ -278,9 +296,9 @@ def get_sample_names(input_dir):
             template_path = find_template_file(input_dir)
         
         if template_path:
-            logger.debug(f"Template file found: {os.path.basename(template_path)}")
+            logger.debug("Template file found: %s", os.path.basename(template_path))
             sample_names = parse_template_file(template_path)
-            logger.debug(f"Successfully parsed {len(sample_names)} sample names from template")
+            logger.debug("Successfully parsed %d sample names from template", len(sample_names))
             return sample_names
         else:
             logger.info(f"No template file found for {os.path.basename(input_dir)}")
@@ -294,3 +312,36 @@ def get_sample_names(input_dir):
         logger.error(error_msg)
         logger.debug(f"Error details: {str(e)}", exc_info=True)
         raise FileProcessingError(error_msg) from e
+
+
+def get_sample_names_batch(input_dirs, max_workers=None):
+    """
+    Get sample names for several input directories concurrently.
+    
+    Template lookup and parsing are dominated by directory listing and file
+    reads, so the directories are processed on a thread pool.
+    
+    Args:
+        input_dirs (list): Input directory paths
+        max_workers (int, optional): Thread count (defaults to min(8, len(input_dirs)))
+        
+    Returns:
+        dict: Mapping of input directory to its well-to-sample-name mapping
+        
+    Raises:
+        FileProcessingError: If an input directory is invalid
+        TemplateError: If a template file cannot be parsed
+    """
+    input_dirs = list(input_dirs)
+    if not input_dirs:
+        return {}
+    
+    if max_workers is None:
+        max_workers = min(8, len(input_dirs))
+    
+    logger.debug("Getting sample names for %d directories with %d workers",
+                 len(input_dirs), max_workers)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(get_sample_names, input_dirs)
+        return dict(zip(input_dirs, results))
@@ -9,11 +9,21 @@ plate layout (A-H rows, 01-12 columns).
 """
 
 import re
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Well ID patterns, compiled once at import
+_FILENAME_WELL_RE = re.compile(r'_([A-H][0-9]{1,2})_Amplitude')
+_LOOSE_WELL_RE = re.compile(r'([A-H])(\d{1,2})')
 
+# Every canonical well ID on a 96-well plate in row-major order (A01-H12)
+_ALL_WELLS = tuple(f"{row}{col:02d}" for row in 'ABCDEFGH' for col in range(1, 13))
+_VALID_WELLS = frozenset(_ALL_WELLS)
+
+
+@functools.lru_cache(maxsize=1024)
 def extract_well_coordinate(filename):
     """
     Extract well coordinate (like A01, E05) from a filename.
@@ -35,22 +45,25 @@ def extract_well_coordinate(filename):
         logger.debug("Empty filename provided")
         return None
         
-    logger.debug(f"Extracting well coordinate from filename: {filename}")
+    logger.debug("Extracting well coordinate from filename: %s", filename)
     
     # Only look for pattern like _A05_Amplitude
-    pattern = r'_([A-H][0-9]{1,2})_Amplitude'
-    matches = re.findall(pattern, filename)
-    
-    if matches:
-        well_id = matches[0]  # Take the first (should only be one)
-        formatted_well = format_well_id(well_id)
-        if formatted_well and is_valid_well(formatted_well):
-            logger.debug(f"Found well coordinate: {well_id} -> formatted as {formatted_well}")
+    # search stops at the first (and normally only) match instead of
+    # collecting every match into a list
+    match = _FILENAME_WELL_RE.search(filename)
+    
+    if match:
+        well_id = match.group(1)
+        # The match is always a non-empty string, so go straight to the cached
+        # formatter; it only ever returns canonical IDs, so no re-validation
+        formatted_well = _format_well_id(well_id)
+        if formatted_well:
+            logger.debug("Found well coordinate: %s -> formatted as %s", well_id, formatted_well)
             return formatted_well
         else:
-            logger.debug(f"Found match {well_id} but it's not a valid well coordinate")
+            logger.debug("Found match %s but it's not a valid well coordinate", well_id)
     
-    logger.debug(f"No well coordinate found in filename: {filename}")
+    logger.debug("No well coordinate found in filename: %s", filename)
     return None
 
 def is_valid_well(well_id):
@@ -72,17 +85,16 @@ def is_valid_well(well_id):
         False
     """
     if not well_id or not isinstance(well_id, str):
-        logger.debug(f"Invalid well format - not a string or empty: {well_id}")
+        logger.debug("Invalid well format - not a string or empty: %s", well_id)
         return False
     
-    # Check format: letter A-H followed by number 01-12
-    pattern = r'^[A-H](0[1-9]|1[0-2])$'
-    is_valid = bool(re.match(pattern, well_id))
+    # Letter A-H followed by number 01-12; a set probe instead of a regex match
+    is_valid = well_id in _VALID_WELLS
     
     if is_valid:
-        logger.debug(f"Well {well_id} is valid")
+        logger.debug("Well %s is valid", well_id)
     else:
-        logger.debug(f"Well {well_id} is invalid (doesn't match pattern {pattern})")
+        logger.debug("Well %s is invalid (expected A01-H12)", well_id)
     
     return is_valid
 
@@ -106,18 +118,25 @@ def format_well_id(well_id):
         None
     """
     if not well_id or not isinstance(well_id, str):
-        logger.debug(f"Cannot format - invalid input: {well_id}")
+        logger.debug("Cannot format - invalid input: %s", well_id)
         return None
-        
-    logger.debug(f"Formatting well ID: {well_id}")
     
-    # Check if it's already in correct format
-    if is_valid_well(well_id):
-        logger.debug(f"Well ID {well_id} already in correct format")
+    return _format_well_id(well_id)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_well_id(well_id):
+    """Format a non-empty well ID string; cached since the same IDs recur per plate."""
+    logger.debug("Formatting well ID: %s", well_id)
+    
+    # Check if it's already in correct format (direct set probe; is_valid_well
+    # would repeat the type check and add its own debug logging)
+    if well_id in _VALID_WELLS:
+        logger.debug("Well ID %s already in correct format", well_id)
         return well_id
     
     # Try to extract row and column
-    match = re.match(r'^([A-H])(\d{1,2})$', well_id.upper())
+    match = _LOOSE_WELL_RE.fullmatch(well_id.upper())
     if match:
         row, col = match.groups()
         col_int = int(col)
@@ -125,12 +144,12 @@ def format_well_id(well_id):
         # Check if column is in range 1-12
         if 1 <= col_int <= 12:
             formatted = f"{row}{col_int:02d}"
-            logger.debug(f"Formatted well ID from {well_id} to {formatted}")
+            logger.debug("Formatted well ID from %s to %s", well_id, formatted)
             return formatted
         else:
-            logger.debug(f"Column number {col_int} out of range (1-12)")
+            logger.debug("Column number %d out of range (1-12)", col_int)
     
-    logger.debug(f"Could not format well ID: {well_id}")
+    logger.debug("Could not format well ID: %s", well_id)
     return None
 
 
@@ -150,14 +169,8 @@ def get_all_wells():
         >>> wells[-1]
         'H12'
     """
-    logger.debug("Generating all well identifiers for 96-well plate")
-    
-    rows = list('ABCDEFGH')
-    cols = [f"{i:02d}" for i in range(1, 13)]
-    wells = [f"{row}{col}" for row in rows for col in cols]
-    
-    logger.debug(f"Generated {len(wells)} well identifiers")
-    return wells
+    # Fresh list so callers may modify it without affecting the shared table
+    return list(_ALL_WELLS)
 
 
 def parse_well_position(well_id):
@@ -178,14 +191,15 @@ def parse_well_position(well_id):
         >>> parse_well_position('invalid')
         (None, None)
     """
-    if not is_valid_well(well_id):
-        logger.debug(f"Cannot parse invalid well ID: {well_id}")
+    # Direct set probe; canonical IDs are always one letter plus two digits
+    if not isinstance(well_id, str) or well_id not in _VALID_WELLS:
+        logger.debug("Cannot parse invalid well ID: %s", well_id)
         return (None, None)
     
     row_letter = well_id[0]
     column_number = int(well_id[1:])
     
-    logger.debug(f"Parsed well {well_id} -> row: {row_letter}, column: {column_number}")
+    logger.debug("Parsed well %s -> row: %s, column: %s", well_id, row_letter, column_number)
     return (row_letter, column_number)
 
 
@@ -206,32 +220,38 @@ def get_well_neighbors(well_id, include_diagonal=False):
         >>> get_well_neighbors('A01')
         ['A02', 'B01']
     """
-    if not is_valid_well(well_id):
-        logger.debug(f"Cannot get neighbors for invalid well: {well_id}")
+    if not isinstance(well_id, str) or well_id not in _VALID_WELLS:
+        logger.debug("Cannot get neighbors for invalid well: %s", well_id)
         return []
     
-    row_letter, column_number = parse_well_position(well_id)
-    neighbors = []
-    
-    # Define relative positions for neighbors
-    if include_diagonal:
-        # Include all 8 surrounding positions
-        deltas = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
-    else:
-        # Only include orthogonal neighbors (up, down, left, right)
-        deltas = [(-1, 0), (0, -1), (0, 1), (1, 0)]
+    table = _DIAGONAL_NEIGHBORS if include_diagonal else _ORTHOGONAL_NEIGHBORS
+    neighbors = list(table[well_id])
     
-    row_num = ord(row_letter) - ord('A')  # Convert A-H to 0-7
-    
-    for delta_row, delta_col in deltas:
-        new_row_num = row_num + delta_row
-        new_col_num = column_number + delta_col
-        
-        # Check bounds
-        if 0 <= new_row_num <= 7 and 1 <= new_col_num <= 12:
-            new_row_letter = chr(ord('A') + new_row_num)
-            neighbor_well = f"{new_row_letter}{new_col_num:02d}"
-            neighbors.append(neighbor_well)
-    
-    logger.debug(f"Found {len(neighbors)} neighbors for well {well_id}: {neighbors}")
-    return neighbors
\ No newline at end of file
+    logger.debug("Found %d neighbors for well %s: %s", len(neighbors), well_id, neighbors)
+    return neighbors
+
+
+def _build_neighbor_table(deltas):
+    """Map every well to its in-bounds neighbors for the given (row, col) offsets."""
+    table = {}
+    for well_id in _ALL_WELLS:
+        row_num = ord(well_id[0]) - ord('A')  # Convert A-H to 0-7
+        column_number = int(well_id[1:])
+        neighbors = []
+        for delta_row, delta_col in deltas:
+            new_row_num = row_num + delta_row
+            new_col_num = column_number + delta_col
+            
+            # Check bounds
+            if 0 <= new_row_num <= 7 and 1 <= new_col_num <= 12:
+                neighbors.append(f"{chr(ord('A') + new_row_num)}{new_col_num:02d}")
+        table[well_id] = tuple(neighbors)
+    return table
+
+
+# Neighbor lookups for get_well_neighbors, precomputed for the fixed 8x12 plate.
+# Only orthogonal neighbors (up, left, right, down), or all 8 surrounding positions.
+_ORTHOGONAL_NEIGHBORS = _build_neighbor_table([(-1, 0), (0, -1), (0, 1), (1, 0)])
+_DIAGONAL_NEIGHBORS = _build_neighbor_table(
+    [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+)